@@ -15,8 +15,10 @@ from reykit.rbase import Base, Error, Exit
 __all__ = (
     'WeChatBase',
     'WeChatError',
+    'WeChatExit',
     'WeChatClientErorr',
     'WeChatTriggerError',
+    'WeChatTriggerExit',
     'WeChatTriggerContinueExit',
     'WeChatTriggerBreakExit'
 )
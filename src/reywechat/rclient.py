@@ -599,7 +599,7 @@ class WeChatClient(WeChatBase):
             and receive_id[-9:] != '@chatroom'
         ):
             at_id = None
-        if type(at_id) == str:
+        if type(at_id) is str:
             at_id = [at_id]
         if at_id is not None:
             at_text = ''.join(
@@ -660,7 +660,7 @@ class WeChatClient(WeChatBase):
             and receive_id[-9:] != '@chatroom'
         ):
             at_id = None
-        if type(at_id) == str:
+        if type(at_id) is str:
             at_id = [at_id]
         if at_id is not None:
             at_text = ''.join(
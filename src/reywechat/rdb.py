@@ -10,9 +10,11 @@
 
 
 from enum import StrEnum
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event, Lock, Timer
 from reydb import rorm, Database
 from reykit.rbase import throw, catch_exc
-from reykit.ros import File
+from reykit.ros import File, os_exists
 from reykit.rtime import now, to_time, time_to, sleep
 from reykit.rwrap import wrap_thread
 from reyserver.rclient import ServerClient
@@ -200,6 +202,10 @@ class WeChatDatabase(WeChatBase):
         self.wechat = wechat
         self.db = db
         self.sclient = sclient
+        self.send_event = Event()
+        self._download_cache: dict[int, tuple[str, str]] = {}
+        self._send_status_buffer: list[dict] = []
+        self._send_status_lock = Lock()
 
         # Build Database.
         self.build_db()
@@ -467,41 +473,35 @@ class WeChatDatabase(WeChatBase):
             for row in contact_table
         ]
 
-        # Insert and update.
-        conn = self.db.wechat.connect()
+        # Insert and update in one transaction, commit at exit.
+        with self.db.wechat.connect() as conn:
 
-        ## Insert.
-        if contact_table != []:
-            conn.execute.insert(
-                'contact_user',
-                user_data,
-                'user_id',
-                'update',
-                update_time=':NOW()'
-            )
+            ## Insert.
+            if contact_table != []:
+                conn.execute.insert(
+                    'contact_user',
+                    user_data,
+                    'user_id',
+                    'update',
+                    update_time=':NOW()'
+                )
 
-        ## Update.
-        if user_ids == []:
-            sql = (
-                'UPDATE "contact_user"\n'
-                'SET "is_contact" = FALSE'
-            )
-        else:
-            sql = (
-                'UPDATE "contact_user"\n'
-                'SET "is_contact" = FALSE\n'
-                'WHERE "user_id" NOT IN :user_ids'
+            ## Update.
+            if user_ids == []:
+                sql = (
+                    'UPDATE "contact_user"\n'
+                    'SET "is_contact" = FALSE'
+                )
+            else:
+                sql = (
+                    'UPDATE "contact_user"\n'
+                    'SET "is_contact" = FALSE\n'
+                    'WHERE "user_id" NOT IN :user_ids'
+                )
+            conn.execute(
+                sql,
+                user_ids=user_ids
             )
-        conn.execute(
-            sql,
-            user_ids=user_ids
-        )
-
-        ## Commit.
-        conn.commit()
-
-        ## Close.
-        conn.close()
 
 
     def update_contact_room(self) -> None:
@@ -523,41 +523,35 @@ class WeChatDatabase(WeChatBase):
             for row in contact_table
         ]
 
-        # Insert and update.
-        conn = self.db.wechat.connect()
+        # Insert and update in one transaction, commit at exit.
+        with self.db.wechat.connect() as conn:
 
-        ## Insert.
-        if contact_table != []:
-            conn.execute.insert(
-                'contact_room',
-                room_data,
-                'room_id',
-                'update',
-                update_time=':NOW()'
-            )
+            ## Insert.
+            if contact_table != []:
+                conn.execute.insert(
+                    'contact_room',
+                    room_data,
+                    'room_id',
+                    'update',
+                    update_time=':NOW()'
+                )
 
-        ## Update.
-        if room_ids == []:
-            sql = (
-                'UPDATE "contact_room"\n'
-                'SET "is_contact" = FALSE'
-            )
-        else:
-            sql = (
-                'UPDATE "contact_room"\n'
-                'SET "is_contact" = FALSE\n'
-                'WHERE "room_id" NOT IN :room_ids'
+            ## Update.
+            if room_ids == []:
+                sql = (
+                    'UPDATE "contact_room"\n'
+                    'SET "is_contact" = FALSE'
+                )
+            else:
+                sql = (
+                    'UPDATE "contact_room"\n'
+                    'SET "is_contact" = FALSE\n'
+                    'WHERE "room_id" NOT IN :room_ids'
+                )
+            conn.execute(
+                sql,
+                room_ids=room_ids
             )
-        conn.execute(
-            sql,
-            room_ids=room_ids
-        )
-
-        ## Commit.
-        conn.commit()
-
-        ## Close.
-        conn.close()
 
 
     def update_contact_room_user(
@@ -602,51 +596,45 @@ class WeChatDatabase(WeChatBase):
             for row in room_user_data
         ]
 
-        # Insert and update.
-        conn = self.db.wechat.connect()
+        # Insert and update in one transaction, commit at exit.
+        with self.db.wechat.connect() as conn:
 
-        ## Insert.
-        if room_user_data != []:
-            conn.execute.insert(
-                'contact_room_user',
-                room_user_data,
-                ('room_id', 'user_id'),
-                'update',
-                update_time=':NOW()'
-            )
+            ## Insert.
+            if room_user_data != []:
+                conn.execute.insert(
+                    'contact_room_user',
+                    room_user_data,
+                    ('room_id', 'user_id'),
+                    'update',
+                    update_time=':NOW()'
+                )
 
-        ## Update.
-        if room_user_ids == []:
-            sql = (
-                'UPDATE "contact_room_user"\n'
-                'SET "is_contact" = FALSE'
-            )
-        elif room_id is None:
-            sql = (
-                'UPDATE "contact_room_user"\n'
-                'SET "is_contact" = FALSE\n'
-                'WHERE CONCAT("room_id", \',\', "user_id") NOT IN :room_user_ids'
-            )
-        else:
-            sql = (
-                'UPDATE "contact_room_user"\n'
-                'SET "is_contact" = FALSE\n'
-                'WHERE (\n'
-                '    "room_id" = :room_id\n'
-                '    AND CONCAT("room_id", \',\', "user_id") NOT IN :room_user_ids\n'
-                ')'
+            ## Update.
+            if room_user_ids == []:
+                sql = (
+                    'UPDATE "contact_room_user"\n'
+                    'SET "is_contact" = FALSE'
+                )
+            elif room_id is None:
+                sql = (
+                    'UPDATE "contact_room_user"\n'
+                    'SET "is_contact" = FALSE\n'
+                    'WHERE CONCAT("room_id", \',\', "user_id") NOT IN :room_user_ids'
+                )
+            else:
+                sql = (
+                    'UPDATE "contact_room_user"\n'
+                    'SET "is_contact" = FALSE\n'
+                    'WHERE (\n'
+                    '    "room_id" = :room_id\n'
+                    '    AND CONCAT("room_id", \',\', "user_id") NOT IN :room_user_ids\n'
+                    ')'
+                )
+            conn.execute(
+                sql,
+                room_user_ids=room_user_ids,
+                room_id=room_id
             )
-        conn.execute(
-            sql,
-            room_user_ids=room_user_ids,
-            room_id=room_id
-        )
-
-        ## Commit.
-        conn.commit()
-
-        ## Close.
-        conn.close()
 
 
     def update_message_send(
@@ -667,6 +655,9 @@ class WeChatDatabase(WeChatBase):
         if not hook_id:
             throw(ValueError, hook_id)
 
+        # Flush, hook ID of record may be still in status buffer.
+        self.__update_send_status()
+
         # Update.
         sql = (
             'UPDATE "message_send"\n'
@@ -882,6 +873,39 @@ class WeChatDatabase(WeChatBase):
         self.wechat.receiver.add_handler(receiver_handler_to_message_receive)
 
 
+    def __update_send_status(self) -> None:
+        """
+        Update field "status" of table "message_send" with buffered records, in one execution.
+        """
+
+        # Parameter.
+        with self._send_status_lock:
+            data = self._send_status_buffer.copy()
+            self._send_status_buffer.clear()
+
+        # Check.
+        if data == []:
+            return
+
+        # Update.
+        try:
+            self.db.wechat.execute.update(
+                'message_send',
+                data
+            )
+
+        # Retry.
+        except:
+            exc_text, *_ = catch_exc()
+            print(exc_text)
+
+            ## Put back to buffer front, keep order.
+            with self._send_status_lock:
+                self._send_status_buffer[:0] = data
+                timer = Timer(1, self.__update_send_status)
+                timer.start()
+
+
     def __add_sender_handler_update_send_status(self) -> None:
         """
         Add sender handler, update field "status" of table "message_send".
@@ -913,11 +937,12 @@ class WeChatDatabase(WeChatBase):
                 'status': status
             }
 
-            # Update.
-            self.db.wechat.execute.update(
-                'message_send',
-                data
-            )
+            # Buffer, update after a short window, merge burst of sends.
+            with self._send_status_lock:
+                self._send_status_buffer.append(data)
+                if len(self._send_status_buffer) == 1:
+                    timer = Timer(0.02, self.__update_send_status)
+                    timer.start()
 
 
         # Add handler.
@@ -940,6 +965,17 @@ class WeChatDatabase(WeChatBase):
         File save path and file name.
         """
 
+        # Downloaded.
+        ## Called by download pool workers concurrently, single dictionary operation is atomic, so no lock.
+        cached = self._download_cache.get(file_id)
+        if cached is not None:
+            cache_path, file_name = cached
+            if os_exists(cache_path):
+                return cache_path, file_name
+
+            ### Evict, cache file deleted.
+            self._download_cache.pop(file_id, None)
+
         # Information.
         file_info = self.sclient.get_file_info(file_id)
         file_md5 = file_info['md5']
@@ -953,6 +989,11 @@ class WeChatDatabase(WeChatBase):
             file_bytes = self.sclient.download_file(file_id)
             cache_path = self.wechat.cache.store(file_bytes, file_name)
 
+        ## Record, limit size.
+        if len(self._download_cache) >= 4096:
+            self._download_cache.clear()
+        self._download_cache[file_id] = cache_path, file_name
+
         return cache_path, file_name
 
 
@@ -962,83 +1003,107 @@ class WeChatDatabase(WeChatBase):
         Start loop read record from table "message_send", put send queue.
         """
 
+        # Parameter.
+
+        ## SQL, build once, the same SQL text each loop is prepared by driver.
+        sql = (
+            'WITH "send" AS (\n'
+            '    UPDATE "message_send"\n'
+            f'    SET "status" = \'{WeChatDatabaseSendStatusEnum.START}\'\n'
+            f'    WHERE "status" = \'{WeChatDatabaseSendStatusEnum.WAIT}\'\n'
+            '    RETURNING "send_id", "type", "receive_id", "parameter", "file_id"\n'
+            ')\n'
+            'SELECT *\n'
+            'FROM "send"\n'
+            'ORDER BY "send_id"'
+        )
+
+        ## Download file thread pool, not keep finished futures, pool live as long as process.
+        download_pool = ThreadPoolExecutor(4)
+
+        ## Connection, keep for loop.
+        conn = self.db.wechat.connect()
+
 
         def __from_message_send() -> None:
             """
             Read record from table "message_send", put send queue.
             """
 
-            # Parameter.
-            conn = self.db.wechat.connect()
+            # Read and update.
+            result = conn.execute(sql)
+
+            # Download, start all files first, downloads overlap each other.
+            rows = []
+            downloads: dict[int, Future] = {}
+            for row in result:
+                file_id = row[-1]
+                if (
+                    file_id is not None
+                    and file_id not in downloads
+                ):
+                    downloads[file_id] = download_pool.submit(self.__download_file, file_id)
+                rows.append(row)
 
-            # Read.
-            where = f'"status" = \'{WeChatDatabaseSendStatusEnum.WAIT}\''
-            result = conn.execute.select(
-                'message_send',
-                ['send_id', 'type', 'receive_id', 'parameter', 'file_id'],
-                where,
-                order='"send_id"'
-            )
-
-            # Convert.
-            if result.empty:
-                conn.close()
-                return
-            table = result.to_table()
+            # Commit.
+            conn.commit()
 
-            # Update.
-            send_ids = [
-                row['send_id']
-                for row in table
-            ]
-            sql = (
-                'UPDATE "message_send"\n'
-                f'SET "status" = \'{WeChatDatabaseSendStatusEnum.START}\'\n'
-                'WHERE "send_id" IN :send_ids'
-            )
-            conn.execute(
-                sql,
-                send_ids=send_ids
-            )
+            # Send, in order of send ID.
+            for send_id, type_, receive_id, parameter, file_id in rows:
+
+                ## Convert, rows are claimed and committed, so failed row must be marked, and not block the rest.
+                try:
+                    send_type = WeChatSendTypeEnum(type_)
+
+                    ### File.
+                    if file_id is not None:
+                        file_path, file_name = downloads[file_id].result()
+                        parameter['file_path'] = file_path
+                        parameter['file_name'] = file_name
+
+                    send_params = WeChatSendParameters(
+                        self.wechat.sender,
+                        send_type,
+                        receive_id,
+                        send_id,
+                        **parameter
+                    )
+
+                ## Fail.
+                except:
+                    exc_text, *_ = catch_exc()
+                    print(exc_text)
+                    data = {
+                        'send_id': send_id,
+                        'update_time': ':NOW()',
+                        'status': WeChatDatabaseSendStatusEnum.FAIL
+                    }
+                    self.db.wechat.execute.update('message_send', data)
+                    continue
 
-            # Send.
-            for row in table:
-                send_id, type_, receive_id, parameter, file_id = row.values()
-                send_type = WeChatSendTypeEnum(type_)
-
-                ## File.
-                if file_id is not None:
-                    try:
-                        file_path, file_name = self.__download_file(file_id)
-                    except:
-                        exc_text, *_ = catch_exc()
-                        print(exc_text)
-                        continue
-                    parameter['file_path'] = file_path
-                    parameter['file_name'] = file_name
-
-                send_params = WeChatSendParameters(
-                    self.wechat.sender,
-                    send_type,
-                    receive_id,
-                    send_id,
-                    **parameter
-                )
                 send_params.status = WeChatSenderStatusEnum.WAIT
                 self.wechat.sender.queue.put(send_params)
 
-            # Commit.
-            conn.commit()
-
 
         # Loop.
         while True:
 
+            # Clear, before read, insert during read set again and not lost.
+            self.send_event.clear()
+
             # Put.
-            __from_message_send()
+            try:
+                __from_message_send()
 
-            # Wait.
-            sleep(1)
+            # Reconnect.
+            except:
+                exc_text, *_ = catch_exc()
+                print(exc_text)
+                conn.close()
+                conn = self.db.wechat.connect()
+
+            # Wait, until insert or timeout, short timeout keep records inserted by other processes sent within about one second.
+            self.send_event.wait(1)
 
 
     def is_valid(
@@ -1154,3 +1219,6 @@ class WeChatDatabase(WeChatBase):
             'message_send',
             data
         )
+
+        # Wake up.
+        self.send_event.set()
@@ -55,6 +55,10 @@ class WeChatLog(WeChatBase):
         self.rrlog_print = Log('WeChat.WeChatPrint')
         self.rrlog_file = Log('WeChat.WeChatFile')
 
+        # Color.
+        self._color_info = self.rrlog.get_level_color_ansi(self.rrlog.INFO)
+        self._color_error = self.rrlog.get_level_color_ansi(self.rrlog.ERROR)
+
         # Add handler.
         self.__add_handler()
 
@@ -157,19 +161,20 @@ class WeChatLog(WeChatBase):
             message_object = message.user
         else:
             message_object = message.room
-        content_print = 'RECEIVE | %-20s' % message_object
-        content_file = 'RECEIVE | %s' % message.params
+        content_print = f'RECEIVE | {message_object!s:<20}'
+        content_file = f'RECEIVE | {message.params}'
         if message.exc_reports == []:
             level = self.rrlog.INFO
+            color_code = self._color_info
         else:
             level = self.rrlog.ERROR
+            color_code = self._color_error
             exc_text = '\n'.join(message.exc_reports)
-            content_print = '%s\n%s' % (content_print, exc_text)
-            content_file = '%s\n%s' % (content_file, exc_text)
+            content_print = f'{content_print}\n{exc_text}'
+            content_file = f'{content_file}\n{exc_text}'
 
         ## Add color.
         if self.rrlog.print_colour:
-            color_code = self.rrlog.get_level_color_ansi(level)
             content_print = f'{color_code}{content_print}\033[0m'
 
         # Log.
@@ -196,22 +201,24 @@ class WeChatLog(WeChatBase):
         """
 
         # Generate record.
-        content_print = 'SEND    | %-20s' % send_params.receive_id
-        content_file = 'SEND    | %s' % {
+        content_print = f'SEND    | {send_params.receive_id!s:<20}'
+        send_info = {
             'receive_id': send_params.receive_id,
             **send_params.params
         }
+        content_file = f'SEND    | {send_info}'
         if send_params.exc_reports == []:
             level = self.rrlog.INFO
+            color_code = self._color_info
         else:
             level = self.rrlog.ERROR
+            color_code = self._color_error
             exc_text = '\n'.join(send_params.exc_reports)
-            content_print = '%s\n%s' % (content_print, exc_text)
-            content_file = '%s\n%s' % (content_file, exc_text)
+            content_print = f'{content_print}\n{exc_text}'
+            content_file = f'{content_file}\n{exc_text}'
 
         ## Add color.
         if self.rrlog.print_colour:
-            color_code = self.rrlog.get_level_color_ansi(level)
             content_print = f'{color_code}{content_print}\033[0m'
 
         # Log.
@@ -13,21 +13,31 @@ from typing import Any, TypedDict, NotRequired, Literal, overload
 from collections.abc import Callable
 from queue import Queue
 from json import loads as json_loads
-from reykit.rbase import throw
+from hashlib import file_digest
+from time import monotonic
+from threading import Event
+from re import compile as re_compile, S as re_S
+from reykit.rbase import throw, catch_exc
 from reykit.rimage import decode_qrcode
 from reykit.rlog import Mark
 from reykit.rnet import listen_socket
 from reykit.ros import File, os_exists
-from reykit.rre import search, search_batch, findall
+from reykit.rre import search_batch
 from reykit.rtask import ThreadPool
-from reykit.rtime import now, sleep, wait, to_time, time_to
-from reykit.rwrap import wrap_thread, wrap_exc
+from reykit.rtime import now, sleep, to_time, time_to
+from reykit.rwrap import wrap_thread
 
 from .rbase import WeChatBase, WeChatTriggerError
 from .rclient import SendLogChat
 from .rsend import WeChatSendTypeEnum, WeChatSenderStatusEnum
 from .rwechat import WeChat
 
+# Faster JSON decode, when installed.
+try:
+    from orjson import loads as orjson_loads, JSONDecodeError as OrjsonDecodeError
+except ImportError:
+    orjson_loads = None
+
 
 __all__ = (
     'WeChatMessage',
@@ -87,6 +97,53 @@ MessageParametersFileUploading = TypedDict(
 )
 
 
+# Regular pattern, compile once, period match any character.
+PATTERN_VOICE_LEN = re_compile(r'voicelength="(\d+)"', re_S)
+PATTERN_VIDEO_LEN = re_compile(r'playlength="(\d+)"', re_S)
+PATTERN_BUSINESS_CARD_NAME = re_compile(r'nickname="([^"]+)"', re_S)
+PATTERN_SHARE_TYPE = re_compile(r'<type>(\d+)</type>', re_S)
+PATTERN_SHARE_APP_NAME = re_compile(r'.*<appname>([^<>]+)</appname>', re_S)
+PATTERN_SHARE_SOURCE_NAME = re_compile(r'.*<sourcedisplayname>([^<>]+)</sourcedisplayname>', re_S)
+PATTERN_SHARE_NICKNAME = re_compile(r'.*<nickname>([^<>]+)</nickname>', re_S)
+PATTERN_SHARE_DES = re_compile(r'.*<des>([^<>]+)</des>', re_S)
+PATTERN_SHARE_DESC = re_compile(r'.*<desc>([^<>]+)</desc>', re_S)
+PATTERN_SHARE_URL = re_compile(r'.*<url>([^<>]+)</url>', re_S)
+PATTERN_TITLE = re_compile(r'<title>([^<>]+)</title>', re_S)
+PATTERN_UPLOADING_NAME = re_compile(r'<title><!\[CDATA\[([^<>]+)\]\]></title>', re_S)
+PATTERN_UPLOADING_MD5 = re_compile(r'<md5><!\[CDATA\[([0-9a-f]{32})\]\]></md5>', re_S)
+PATTERN_TOTALLEN = re_compile(r'<totallen>(\d+)</totallen>', re_S)
+PATTERN_QUOTE = re_compile(
+    r'<title>(?P<text>[^<>]+)</title>.*?<refermsg>.*?<type>(?P<type>[^<>]+)</type>.*?<svrid>(?P<id>[^<>]+)</svrid>'
+    r'.*?<chatusr>(?P<user>[^<>]+)</chatusr>.*?<displayname>(?P<user_name>[^<>]+)</displayname>'
+    r'.*?<content>(?P<data>[^<>]+)</content>.*?<createtime>(?P<time>[^<>]+)</createtime>',
+    re_S
+)
+PATTERN_QUOTE_ID = re_compile(r'<svrid>([^<>]+)</svrid>', re_S)
+PATTERN_QUOTE_TIME = re_compile(r'<createtime>([^<>]+)</createtime>', re_S)
+PATTERN_QUOTE_TYPE = re_compile(r'<refermsg>.*?<type>([^<>]+)</type>', re_S)
+PATTERN_QUOTE_USER = re_compile(r'<chatusr>([^<>]+)</chatusr>', re_S)
+PATTERN_QUOTE_USER_NAME = re_compile(r'<displayname>([^<>]+)</displayname>', re_S)
+PATTERN_QUOTE_DATA = re_compile(r'<content>([^<>]+)</content>', re_S)
+PATTERN_MONEY_AMOUNT = re_compile(r'<feedesc><!\[CDATA\[￥([\d.,]+)\]\]></feedesc>', re_S)
+PATTERN_APP_NAME = re_compile(r'<appname>[^<>]+</appname>', re_S)
+PATTERN_AT_NAME = re_compile(r'@(\w+)\u2005', re_S)
+PATTERN_PAT_TEMPLATE = re_compile(r'<template><!\[CDATA\[([^<>]+)\]\]></template>', re_S)
+PATTERN_PAT_USER = re_compile(r'"\$\{([\da-z_]+)\}"', re_S)
+PATTERN_NEW_ROOM_USER_NAME = re_compile(r'邀请"(.+?)"加入了群聊', re_S)
+PATTERN_CHANGE_ROOM_NAME = re_compile(r'修改群名为“(.+?)”', re_S)
+PATTERN_HTML = re_compile(r'^<(\S+)[ >].*</\1>\s*', re_S)
+PATTERN_CALLBACK_FILE = re_compile(r'^\[(?:file|pic)=(.+?)(?:,isDecrypt=[01])?\]$', re_S)
+PATTERN_FILE_MEDIA = re_compile(r' length="(?P<size>\d+)".*? md5="(?P<md5>[\da-f]{32})"', re_S)
+PATTERN_FILE_OTHER = re_compile(
+    r'<title>(?P<name>[^<>]+?)</title>.*?<totallen>(?P<size>\d+)</totallen>.*?<md5>(?P<md5>[\da-f]{32})</md5>',
+    re_S
+)
+PATTERN_FILE_MD5_ATTR = re_compile(r' md5="([\da-f]{32})"', re_S)
+PATTERN_FILE_LENGTH_ATTR = re_compile(r' length="(\d+)"', re_S)
+PATTERN_FILE_MD5 = re_compile(r'<md5>([\da-f]{32})</md5>', re_S)
+PATTERN_FILE_TITLE = re_compile(r'<title>([^<>]+?)</title>', re_S)
+
+
 class WeChatMessage(WeChatBase):
     """
     WeChat message type.
@@ -210,9 +267,7 @@ class WeChatMessage(WeChatBase):
             return self._cache['user_name']
 
         # Set.
-        self._cache['user_name'] = self.receiver.wechat.client.get_contact_name(
-            self.user
-        )
+        self._cache['user_name'] = self.receiver.get_contact_name(self.user)
 
         return self._cache['user_name']
 
@@ -236,9 +291,7 @@ class WeChatMessage(WeChatBase):
             return self._cache['room_name']
 
         # Set.
-        self._cache['room_name'] = self.receiver.wechat.client.get_contact_name(
-            self.room
-        )
+        self._cache['room_name'] = self.receiver.get_contact_name(self.room)
 
         return self._cache['room_name']
 
@@ -447,8 +500,7 @@ class WeChatMessage(WeChatBase):
             throw(AssertionError, self.type)
 
         # Get.
-        pattern = r'voicelength="(\d+)"'
-        voice_len_us_str = search(pattern, self.data)
+        voice_len_us_str = PATTERN_VOICE_LEN.search(self.data)[1]
         self._cache['voice_len'] = int(voice_len_us_str) / 1000
 
         return self._cache['voice_len']
@@ -473,8 +525,7 @@ class WeChatMessage(WeChatBase):
             throw(AssertionError, self.type)
 
         # Get.
-        pattern = r'playlength="(\d+)"'
-        video_len_s_str = search(pattern, self.data)
+        video_len_s_str = PATTERN_VIDEO_LEN.search(self.data)[1]
         self._cache['video_len'] = int(video_len_s_str)
 
         return self._cache['video_len']
@@ -499,8 +550,8 @@ class WeChatMessage(WeChatBase):
             throw(AssertionError, self.type)
 
         # Get.
-        pattern = r'nickname="([^"]+)"'
-        self._cache['business_card_name'] = search(pattern, self.data)
+        match = PATTERN_BUSINESS_CARD_NAME.search(self.data)
+        self._cache['business_card_name'] = match and match[1]
 
         return self._cache['business_card_name']
 
@@ -524,8 +575,7 @@ class WeChatMessage(WeChatBase):
             throw(AssertionError, self.type)
 
         # Get.
-        pattern = r'<type>(\d+)</type>'
-        share_type_str: str = search(pattern, self.data)
+        share_type_str: str = PATTERN_SHARE_TYPE.search(self.data)[1]
         self._cache['share_type'] = int(share_type_str)
 
         return self._cache['share_type']
@@ -550,16 +600,21 @@ class WeChatMessage(WeChatBase):
             throw(AssertionError, self.type)
 
         # Extract.
-        name: str | None = search('.*<appname>([^<>]+)</appname>', self.data)
-        if name is None:
-            name: str | None = search('.*<sourcedisplayname>([^<>]+)</sourcedisplayname>', self.data)
-        if name is None:
-            name: str | None = search('.*<nickname>([^<>]+)</nickname>', self.data)
-        title: str | None = search('<title>([^<>]+)</title>', self.data)
-        desc: str | None = search('.*<des>([^<>]+)</des>', self.data)
-        if desc is None:
-            desc: str | None = search('.*<desc>([^<>]+)</desc>', self.data)
-        url: str | None = search('.*<url>([^<>]+)</url>', self.data)
+        match = (
+            PATTERN_SHARE_APP_NAME.search(self.data)
+            or PATTERN_SHARE_SOURCE_NAME.search(self.data)
+            or PATTERN_SHARE_NICKNAME.search(self.data)
+        )
+        name: str | None = match and match[1]
+        match = PATTERN_TITLE.search(self.data)
+        title: str | None = match and match[1]
+        match = (
+            PATTERN_SHARE_DES.search(self.data)
+            or PATTERN_SHARE_DESC.search(self.data)
+        )
+        desc: str | None = match and match[1]
+        match = PATTERN_SHARE_URL.search(self.data)
+        url: str | None = match and match[1]
         self._cache['share_params'] = {
             'name': name,
             'title': title,
@@ -613,10 +668,12 @@ class WeChatMessage(WeChatBase):
 
         # Get.
         params = {}
-        params['name'] = search(r'<title><!\[CDATA\[([^<>]+)\]\]></title>', self.data)
-        params['size'] = search(r'<totallen>(\d+)</totallen>', self.data)
+        match = PATTERN_UPLOADING_NAME.search(self.data)
+        params['name'] = match and match[1]
+        params['size'] = PATTERN_TOTALLEN.search(self.data)[1]
         params['size'] = int(params['size'])
-        params['md5'] = search(r'<md5><!\[CDATA\[([0-9a-f]{32})\]\]></md5>', self.data)
+        match = PATTERN_UPLOADING_MD5.search(self.data)
+        params['md5'] = match and match[1]
         self._cache['file_params_uploading'] = params
 
         return self._cache['file_params_uploading']
@@ -731,7 +788,7 @@ class WeChatMessage(WeChatBase):
         # Judge.
         self._cache['is_quote_me'] = (
             self.is_quote
-            and '<chatusr>%s</chatusr>' % self.receiver.wechat.client.login_info['id'] in self.data
+            and self.receiver.quote_me_keyword in self.data
         )
 
         return self._cache['is_quote_me']
@@ -763,23 +820,35 @@ class WeChatMessage(WeChatBase):
             throw(AssertionError, self._cache['is_quote'])
 
         # Extract.
-        pattern = '<title>([^<>]+)</title>'
-        text: str = search(pattern, self.data)
-        pattern = r'<svrid>([^<>]+)</svrid>'
-        quote_id = search(pattern, self.data)
-        quote_id = int(quote_id)
-        pattern = r'<createtime>([^<>]+)</createtime>'
-        quote_time = search(pattern, self.data)
-        quote_time = int(quote_time)
-        pattern = r'<refermsg>.*?<type>([^<>]+)</type>'
-        quote_type = search(pattern, self.data)
-        quote_type = int(quote_type)
-        pattern = r'<chatusr>([^<>]+)</chatusr>'
-        quote_user: str = search(pattern, self.data)
-        pattern = '<displayname>([^<>]+)</displayname>'
-        quote_user_name: str = search(pattern, self.data)
-        pattern = '<content>([^<>]+)</content>'
-        quote_data: str = search(pattern, self.data)
+        match = PATTERN_QUOTE.search(self.data)
+
+        ## One scan.
+        if match is not None:
+            text: str = match['text']
+            quote_id = int(match['id'])
+            quote_time = int(match['time'])
+            quote_type = int(match['type'])
+            quote_user: str = match['user']
+            quote_user_name: str = match['user_name']
+            quote_data: str = match['data']
+
+        ## Field missing or in other order.
+        else:
+            match = PATTERN_TITLE.search(self.data)
+            text: str = match and match[1]
+            quote_id = PATTERN_QUOTE_ID.search(self.data)[1]
+            quote_id = int(quote_id)
+            quote_time = PATTERN_QUOTE_TIME.search(self.data)[1]
+            quote_time = int(quote_time)
+            quote_type = PATTERN_QUOTE_TYPE.search(self.data)[1]
+            quote_type = int(quote_type)
+            match = PATTERN_QUOTE_USER.search(self.data)
+            quote_user: str = match and match[1]
+            match = PATTERN_QUOTE_USER_NAME.search(self.data)
+            quote_user_name: str = match and match[1]
+            match = PATTERN_QUOTE_DATA.search(self.data)
+            quote_data: str = match and match[1]
+
         self._cache['quote_params'] = {
             'text': text,
             'quote_id': quote_id,
@@ -835,7 +904,7 @@ class WeChatMessage(WeChatBase):
             throw(AssertionError, self._cache['is_money'])
 
         # Judge.
-        amount_str: str = search(r'<feedesc><!\[CDATA\[￥([\d.,]+)\]\]></feedesc>', self.data)
+        amount_str: str = PATTERN_MONEY_AMOUNT.search(self.data)[1]
         self._cache['money_amount'] = float(amount_str)
 
         return self._cache['money_amount']
@@ -858,12 +927,39 @@ class WeChatMessage(WeChatBase):
         # Judge.
         self._cache['is_app'] = (
             self.type == 49
-            and search('<appname>[^<>]+</appname>', self.data) is not None
+            and PATTERN_APP_NAME.search(self.data) is not None
         )
 
         return self._cache['is_app']
 
 
+    @property
+    def at_text(self) -> str | None:
+        """
+        Return text that can contain `@`.
+
+        Returns
+        -------
+        Text.
+            - `None`: Not text message or quote message.
+        """
+
+        # Cache.
+        if 'at_text' in self._cache:
+            return self._cache['at_text']
+
+        # Get.
+        if self.type == 1:
+            text = self.data
+        elif self.is_quote:
+            text = self.quote_params['text']
+        else:
+            text = None
+        self._cache['at_text'] = text
+
+        return self._cache['at_text']
+
+
     @property
     def at_names(self) -> list[str]:
         """
@@ -879,12 +975,11 @@ class WeChatMessage(WeChatBase):
             return self._cache['at_names']
 
         # Get.
-        if self.type == 1:
-            text = self.data
-        elif self.is_quote:
-            text = self.quote_params['text']
-        pattern = r'@(\w+)\u2005'
-        self._cache['at_names'] = findall(pattern, text)
+        text = self.at_text
+        if text is None:
+            self._cache['at_names'] = []
+        else:
+            self._cache['at_names'] = PATTERN_AT_NAME.findall(text)
 
         return self._cache['at_names']
 
@@ -904,7 +999,14 @@ class WeChatMessage(WeChatBase):
             return self._cache['is_at']
 
         # Judge.
-        self._cache['is_at'] = self.at_names != []
+        if 'at_names' in self._cache:
+            self._cache['is_at'] = self._cache['at_names'] != []
+        else:
+            text = self.at_text
+            self._cache['is_at'] = (
+                text is not None
+                and PATTERN_AT_NAME.search(text) is not None
+            )
 
         return self._cache['is_at']
 
@@ -924,7 +1026,11 @@ class WeChatMessage(WeChatBase):
             return self._cache['is_at_me']
 
         # Judge.
-        self._cache['is_at_me'] = self.receiver.wechat.client.login_info['name'] in self.at_names
+        text = self.at_text
+        self._cache['is_at_me'] = (
+            text is not None
+            and self.receiver.at_me_keyword in text
+        )
 
         return self._cache['is_at_me']
 
@@ -972,7 +1078,7 @@ class WeChatMessage(WeChatBase):
             or self.is_pat_me
 
             ## At self.
-            or '@%s\u2005' % self.receiver.wechat.client.login_info['name'] in self.data
+            or self.receiver.at_me_keyword in self.data
 
             ## Call self.
             or self.data.lstrip().startswith(self.receiver.call_name)
@@ -1009,14 +1115,12 @@ class WeChatMessage(WeChatBase):
         ## Replace.
 
         ### At.
-        at_me_keyword = '@%s\u2005' % self.receiver.wechat.client.login_info['name']
-        text = text.replace(at_me_keyword, '')
+        text = text.replace(self.receiver.at_me_keyword, '')
 
         ### Call.
-        pattern = fr'^\s*{self.receiver.call_name}[\s,，]*(.*)$'
-        result: str | None = search(pattern, text)
-        if result is not None:
-            text = result
+        match = self.receiver.pattern_call.search(text)
+        if match is not None:
+            text = match[1]
 
         self._cache['call_text'] = text.strip()
 
@@ -1116,10 +1220,9 @@ class WeChatMessage(WeChatBase):
             return self._cache['is_pat_me']
 
         # Judge.
-        pattern = fr'<template><!\[CDATA\["\$\{{[\da-z_]+\}}" 拍了拍(?:我| "\$\{{{self.receiver.wechat.client.login_info['id']}\}}")\]\]></template>'
         self._cache['is_pat_me'] = (
             self.is_pat
-            and search(pattern, self.data) is not None
+            and self.receiver.pattern_pat_me.search(self.data) is not None
         )
 
         return self._cache['is_pat_me']
@@ -1146,14 +1249,12 @@ class WeChatMessage(WeChatBase):
         # Get.
 
         ## Text.
-        pattern = r'<template><!\[CDATA\[([^<>]+)\]\]></template>'
-        text: str = search(pattern, self.data)
+        text: str = PATTERN_PAT_TEMPLATE.search(self.data)[1]
 
         ## User name.
-        pattern = r'"\$\{([\da-z_]+)\}"'
-        users_id: list[str] = findall(pattern, text)
+        users_id: list[str] = PATTERN_PAT_USER.findall(text)
         for user_id in users_id:
-            user_name = self.receiver.wechat.client.get_contact_name(user_id)
+            user_name = self.receiver.get_contact_name(user_id)
             old_text = '${%s}' % user_id
             text = text.replace(old_text, user_name)
 
@@ -1185,6 +1286,61 @@ class WeChatMessage(WeChatBase):
         return self._cache['is_recall']
 
 
+    @property
+    def system_kind(self) -> Literal[
+        'new_user',
+        'new_room',
+        'new_room_user',
+        'change_room_name',
+        'kick_out_room',
+        'dissolve_room'
+    ] | None:
+        """
+        Return kind of system message, judge once for all system message properties.
+
+        Returns
+        -------
+        Kind.
+            - `None`: Not system message or unknown kind.
+        """
+
+        # Cache.
+        if 'system_kind' in self._cache:
+            return self._cache['system_kind']
+
+        # Judge, head range search by bounds, without slice copy.
+        data = self.data
+        if self.type != 10000:
+            kind = None
+        elif (
+            data == '以上是打招呼的内容'
+            or data.startswith('你已添加了')
+            or data.endswith('，现在可以开始聊天了。')
+        ):
+            kind = 'new_user'
+        elif data.startswith('你被') and data.endswith('移出群聊'):
+            kind = 'kick_out_room'
+        elif data.startswith('群主') and data.endswith('已解散该群聊'):
+            kind = 'dissolve_room'
+        elif (
+            data.find('邀请你和', 0, 38) != -1
+            or data.find('邀请你加入了群聊', 0, 42) != -1
+        ):
+            kind = 'new_room'
+        elif (
+            data.find('邀请"', 0, 37) != -1
+            and data.endswith('"加入了群聊')
+        ):
+            kind = 'new_room_user'
+        elif data.find('修改群名为“', 0, 40) != -1:
+            kind = 'change_room_name'
+        else:
+            kind = None
+        self._cache['system_kind'] = kind
+
+        return self._cache['system_kind']
+
+
     @property
     def is_new_user(self) -> bool:
         """
@@ -1200,14 +1356,7 @@ class WeChatMessage(WeChatBase):
             return self._cache['is_new_user']
 
         # Judge.
-        self._cache['is_new_user'] = (
-            self.type == 10000
-            and (
-                self.data == '以上是打招呼的内容'
-                or self.data.startswith('你已添加了')
-                or self.data.endswith('，现在可以开始聊天了。')
-            )
-        )
+        self._cache['is_new_user'] = self.system_kind == 'new_user'
 
         return self._cache['is_new_user']
 
@@ -1227,13 +1376,7 @@ class WeChatMessage(WeChatBase):
             return self._cache['is_new_room']
 
         # Judge.
-        self._cache['is_new_room'] = (
-            self.type == 10000
-            and (
-                '邀请你和' in self.data[:38]
-                or '邀请你加入了群聊' in self.data[:42]
-            )
-        )
+        self._cache['is_new_room'] = self.system_kind == 'new_room'
 
         return self._cache['is_new_room']
 
@@ -1253,11 +1396,7 @@ class WeChatMessage(WeChatBase):
             return self._cache['is_new_room_user']
 
         # Judge.
-        self._cache['is_new_room_user'] = (
-            self.type == 10000
-            and '邀请"' in self.data[:37]
-            and self.data.endswith('"加入了群聊')
-        )
+        self._cache['is_new_room_user'] = self.system_kind == 'new_room_user'
 
         return self._cache['is_new_room_user']
 
@@ -1277,8 +1416,8 @@ class WeChatMessage(WeChatBase):
             return self._cache['new_room_user_name']
 
         # Extract.
-        pattern = '邀请"(.+?)"加入了群聊'
-        result: str = search(pattern, self.data)
+        match = PATTERN_NEW_ROOM_USER_NAME.search(self.data)
+        result: str | None = match and match[1]
         self._cache['new_room_user_name'] = result
 
         return result
@@ -1299,10 +1438,7 @@ class WeChatMessage(WeChatBase):
             return self._cache['is_change_room_name']
 
         # Judge.
-        self._cache['is_change_room_name'] = (
-            self.type == 10000
-            and '修改群名为“' in self.data[:40]
-        )
+        self._cache['is_change_room_name'] = self.system_kind == 'change_room_name'
 
         return self._cache['is_change_room_name']
 
@@ -1322,8 +1458,8 @@ class WeChatMessage(WeChatBase):
             return self._cache['change_room_name']
 
         # Extract.
-        pattern = '修改群名为“(.+?)”'
-        result: str = search(pattern, self.data)
+        match = PATTERN_CHANGE_ROOM_NAME.search(self.data)
+        result: str | None = match and match[1]
         self._cache['change_room_name'] = result
 
         return self._cache['change_room_name']
@@ -1344,11 +1480,7 @@ class WeChatMessage(WeChatBase):
             return self._cache['is_kick_out_room']
 
         # Judge.
-        self._cache['is_kick_out_room'] = (
-            self.type == 10000
-            and self.data.startswith('你被')
-            and self.data.endswith('移出群聊')
-        )
+        self._cache['is_kick_out_room'] = self.system_kind == 'kick_out_room'
 
         return self._cache['is_kick_out_room']
 
@@ -1368,11 +1500,7 @@ class WeChatMessage(WeChatBase):
             return self._cache['is_dissolve_room']
 
         # Judge.
-        self._cache['is_dissolve_room'] = (
-            self.type == 10000
-            and self.data.startswith('群主')
-            and self.data.endswith('已解散该群聊')
-        )
+        self._cache['is_dissolve_room'] = self.system_kind == 'dissolve_room'
 
         return self._cache['is_dissolve_room']
 
@@ -1418,7 +1546,7 @@ class WeChatMessage(WeChatBase):
         # Judge.
         self._cache['is_html'] = (
             self.type != 1
-            and search(r'^<(\S+)[ >].*</\1>\s*', self.data) is not None
+            and PATTERN_HTML.search(self.data) is not None
         )
 
         return self._cache['is_html']
@@ -1646,12 +1774,28 @@ class WechatReceiver(WeChatBase):
         # Set attribute.
         self.wechat = wechat
         self.max_receiver = max_receiver
-        call_name = call_name or self.wechat.client.login_info['name']
+        login_id = self.wechat.client.login_info['id']
+        login_name = self.wechat.client.login_info['name']
+        call_name = call_name or login_name
         self.call_name = call_name
+        self.pattern_call = re_compile(fr'^\s*{call_name}[\s,，]*(.*)$', re_S)
+        self.at_me_keyword = '@%s\u2005' % login_name
+        self.quote_me_keyword = '<chatusr>%s</chatusr>' % login_id
+        self.pattern_pat_me = re_compile(
+            fr'<template><!\[CDATA\["\$\{{[\da-z_]+\}}" 拍了拍(?:我| "\$\{{{login_id}\}}")\]\]></template>',
+            re_S
+        )
         self.queue: Queue[WeChatMessage] = Queue()
-        self.handlers: list[Callable[[WeChatMessage], Any]] = []
+        self.handlers: tuple[Callable[[WeChatMessage], Any], ...] = ()
+        'Read only, add through method `add_handler`.'
+        self._handlers_dispatch: tuple[Callable[[WeChatMessage], Any], ...] = (self.__receiver_handler_file,)
+        'Snapshot of handlers for dispatch, replace whole when add handler.'
         self.started: bool | None = False
+        self.started_event = Event()
+        'Set when started or ended, receiver loop wait it when stopped.'
         self.mark = Mark()
+        self._contact_names: dict[str, tuple[str, float]] = {}
+        'Contact name cache, value is name and expire monotonic time.'
         self.trigger = WeChatTrigger(self)
 
         # Start.
@@ -1680,7 +1824,19 @@ class WechatReceiver(WeChatBase):
                 _, data_body = data.split(b'\r\n\r\n', 1)
                 if data_body == b'':
                     return
-                data_json: dict = json_loads(data_body)
+
+                ## Not message frame, skip decode.
+                if b'"msgId"' not in data_body:
+                    return
+
+                ## Decode, orjson reject lone surrogate and BOM that standard decoder accept, then retry.
+                if orjson_loads is None:
+                    data_json: dict = json_loads(data_body)
+                else:
+                    try:
+                        data_json: dict = orjson_loads(data_body)
+                    except OrjsonDecodeError:
+                        data_json: dict = json_loads(data_body)
             except:
                 throw(AssertionError, data)
 
@@ -1714,10 +1870,9 @@ class WechatReceiver(WeChatBase):
             ## File.
             file = None
             if params['msgXml'] != '':
-                pattern = r'^\[(?:file|pic)=(.+?)(?:,isDecrypt=[01])?\]$'
-                path = search(pattern, params['msg'])
-                if path is not None:
-                    file = {'path': path}
+                match = PATTERN_CALLBACK_FILE.search(params['msg'])
+                if match is not None:
+                    file = {'path': match[1]}
 
             # Put.
             message = WeChatMessage(
@@ -1765,31 +1920,19 @@ class WechatReceiver(WeChatBase):
             message : `WeChatMessage` instance.
             """
 
-            # Parameter.
-            handlers = [
-                self.__receiver_handler_file,
-                *self.handlers
-            ]
-
-
             # Handle.
-            def handle_handler_exception(exc_text, *_) -> None:
-                """
-                Handle Handler exception.
-
-                Parameters
-                ----------
-                exc_text : Exception report text.
-                """
+            for handler in self._handlers_dispatch:
+                try:
+                    handler(message)
 
-                # Save.
-                message.exc_reports.append(exc_text)
+                # Exception.
+                except BaseException:
 
+                    ## Catch exception.
+                    exc_text, *_ = catch_exc()
 
-            ## Loop.
-            for handler in handlers:
-                handler = wrap_exc(handler, handler=handle_handler_exception)
-                handler(message)
+                    ## Save.
+                    message.exc_reports.append(exc_text)
 
             # Log.
             self.wechat.error.log_receive(message)
@@ -1807,7 +1950,7 @@ class WechatReceiver(WeChatBase):
 
                 ## Stop.
                 case False:
-                    sleep(0.1)
+                    self.started_event.wait()
                     continue
 
                 ## End.
@@ -1831,8 +1974,49 @@ class WechatReceiver(WeChatBase):
         handler : Handler method, input parameter is `WeChatMessage` instance.
         """
 
-        # Add.
-        self.handlers.append(handler)
+        # Add, replace whole tuple, so handler not added by method cannot be silently skipped by dispatch.
+        self.handlers = (*self.handlers, handler)
+
+        # Compile.
+        self._handlers_dispatch = (self.__receiver_handler_file, *self.handlers)
+
+
+    def get_contact_name(
+        self,
+        id_: str,
+        expire: float = 60
+    ) -> str:
+        """
+        Get contact name, share cache between messages, cache expire after a period to follow rename.
+
+        Parameters
+        ----------
+        id\\_ : User ID or chat room ID.
+        expire : Cache expire seconds.
+
+        Returns
+        -------
+        User nickname or chat room name.
+        """
+
+        # Cache.
+        now_time = monotonic()
+        cache = self._contact_names.get(id_)
+        if (
+            cache is not None
+            and cache[1] > now_time
+        ):
+            return cache[0]
+
+        # Request.
+        name = self.wechat.client.get_contact_name(id_)
+
+        # Save.
+        if len(self._contact_names) >= 4096:
+            self._contact_names.clear()
+        self._contact_names[id_] = (name, now_time + expire)
+
+        return name
 
 
     def __receiver_handler_file(
@@ -1844,7 +2028,7 @@ class WechatReceiver(WeChatBase):
         """
 
         # Check.
-        if type(message.file) != dict:
+        if type(message.file) is not dict:
             return
 
         # Download.
@@ -1852,31 +2036,43 @@ class WechatReceiver(WeChatBase):
 
             ## Image.
             case 3:
-                pattern = r' md5="([\da-f]{32})"'
-                file_md5: str = search(pattern, message.data)
+                match = PATTERN_FILE_MEDIA.search(message.data)
+                if match is not None:
+                    file_md5: str = match['md5']
+                    file_size = int(match['size'])
+
+                ### Field in other order.
+                else:
+                    file_md5: str = PATTERN_FILE_MD5_ATTR.search(message.data)[1]
+                    file_size = int(PATTERN_FILE_LENGTH_ATTR.search(message.data)[1])
                 file_name = f'{file_md5}.jpg'
-                pattern = r' length="(\d+)"'
-                file_size: str = search(pattern, message.data)
-                file_size = int(file_size)
 
             ## Video.
             case 43:
-                pattern = r' md5="([\da-f]{32})"'
-                file_md5: str = search(pattern, message.data)
+                match = PATTERN_FILE_MEDIA.search(message.data)
+                if match is not None:
+                    file_md5: str = match['md5']
+                    file_size = int(match['size'])
+
+                ### Field in other order.
+                else:
+                    file_md5: str = PATTERN_FILE_MD5_ATTR.search(message.data)[1]
+                    file_size = int(PATTERN_FILE_LENGTH_ATTR.search(message.data)[1])
                 file_name = f'{file_md5}.mp4'
-                pattern = r' length="(\d+)"'
-                file_size: str = search(pattern, message.data)
-                file_size = int(file_size)
 
             ## Other.
             case 49 if message.is_file_uploaded:
-                pattern = r'<md5>([\da-f]{32})</md5>'
-                file_md5: str = search(pattern, message.data)
-                pattern = r'<title>([^<>]+?)</title>'
-                file_name: str = search(pattern, message.data)
-                pattern = r'<totallen>(\d+)</totallen>'
-                file_size: str = search(pattern, message.data)
-                file_size = int(file_size)
+                match = PATTERN_FILE_OTHER.search(message.data)
+                if match is not None:
+                    file_md5: str = match['md5']
+                    file_name: str = match['name']
+                    file_size = int(match['size'])
+
+                ### Field in other order.
+                else:
+                    file_md5: str = PATTERN_FILE_MD5.search(message.data)[1]
+                    file_name: str = PATTERN_FILE_TITLE.search(message.data)[1]
+                    file_size = int(PATTERN_TOTALLEN.search(message.data)[1])
 
             ## Break.
             case _:
@@ -1888,17 +2084,24 @@ class WechatReceiver(WeChatBase):
 
         # Cache.
         cache_path = self.wechat.cache.index(file_md5, file_name, copy=True)
+        cache_md5 = file_md5
         if cache_path is None:
 
-            ## Wait.
-            wait(
-                os_exists,
-                message.file['path'],
-                _interval = 0.05,
-                _timeout=3600
-            )
+            ## Wait, check interval grow from 10ms to 100ms, small file found fast, large file check less, and finished file not wait long.
+            interval = 0.01
+            waited = 0
+            while not os_exists(message.file['path']):
+                if waited > 3600:
+                    throw(TimeoutError, message.file['path'])
+                sleep(interval)
+                waited += interval
+                interval = min(interval * 2, 0.1)
             sleep(0.2)
 
+            ## Hash, chunked read, avoid load whole file to memory.
+            with open(message.file['path'], 'rb') as file:
+                cache_md5 = file_digest(file, 'md5').hexdigest()
+
             cache_path = self.wechat.cache.store(message.file['path'], file_name, delete=True)
 
         # Parameter.
@@ -1906,7 +2109,7 @@ class WechatReceiver(WeChatBase):
         message_file: MessageParametersFile = {
             'path': cache_path,
             'name': cache_file.name_suffix,
-            'md5': cache_file.md5,
+            'md5': cache_md5,
             'size': cache_file.size
         }
         message.file = message_file
@@ -1919,6 +2122,7 @@ class WechatReceiver(WeChatBase):
 
         # Start.
         self.started = True
+        self.started_event.set()
 
         # Report.
         print('Start receiver.')
@@ -1931,6 +2135,7 @@ class WechatReceiver(WeChatBase):
 
         # Stop.
         self.started = False
+        self.started_event.clear()
 
         # Report.
         print('Stop receiver.')
@@ -1943,6 +2148,7 @@ class WechatReceiver(WeChatBase):
 
         # End.
         self.started = None
+        self.started_event.set()
 
         # Report.
         print('End receiver.')
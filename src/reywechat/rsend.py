@@ -14,11 +14,12 @@ from collections.abc import Callable
 from enum import StrEnum
 from functools import wraps as functools_wraps
 from queue import Queue
+from threading import Event
 from reykit.rbase import throw, catch_exc, get_arg_info
-from reykit.rtime import now, sleep
+from reykit.rtime import now
 from reykit.rwrap import wrap_thread, wrap_exc
 
-from .rbase import WeChatBase, WeChatTriggerContinueExit, WeChatTriggerBreakExit
+from .rbase import WeChatBase, WeChatTriggerExit
 from .rclient import SendLogChat
 from .rwechat import WeChat
 
@@ -250,6 +251,29 @@ class WeChatSender(WeChatBase):
         self.queue: Queue[WeChatSendParameters] = Queue()
         self.handlers: list[Callable[[WeChatSendParameters], Any]] = []
         self.started: bool | None = False
+        self.started_event = Event()
+        'Set when started or ended, sender loop wait it when stopped.'
+
+        ## Send method and its parameter names of each send type, inspect once.
+        send_funcs = {
+            WeChatSendTypeEnum.TEXT: self.wechat.client.send_text,
+            WeChatSendTypeEnum.TEXT_QUOTE: self.wechat.client.send_text_quote,
+            WeChatSendTypeEnum.FILE: self.wechat.client.send_file,
+            WeChatSendTypeEnum.IMAGE: self.wechat.client.send_image,
+            WeChatSendTypeEnum.EMOTION: self.wechat.client.send_emotion,
+            WeChatSendTypeEnum.SHARE: self.wechat.client.send_share,
+            WeChatSendTypeEnum.LOG: self.wechat.client.send_log
+        }
+        self._send_funcs: dict[WeChatSendTypeEnum, tuple[Callable[..., list[str] | None], frozenset[str]]] = {
+            send_type: (
+                send_func,
+                frozenset(
+                    item['name']
+                    for item in get_arg_info(send_func)
+                )
+            )
+            for send_type, send_func in send_funcs.items()
+        }
 
         # Start.
         self.__start_sender()
@@ -268,7 +292,7 @@ class WeChatSender(WeChatBase):
 
                 ## Stop.
                 case False:
-                    sleep(0.1)
+                    self.started_event.wait()
                     continue
 
                 ## End.
@@ -335,32 +359,15 @@ class WeChatSender(WeChatBase):
             send_params.params['text'] = modify_text
 
         # Method.
-        match send_params.send_type:
-            case WeChatSendTypeEnum.TEXT:
-                send_func = self.wechat.client.send_text
-            case WeChatSendTypeEnum.TEXT_QUOTE:
-                send_func = self.wechat.client.send_text_quote
-            case WeChatSendTypeEnum.FILE:
-                send_func = self.wechat.client.send_file
-            case WeChatSendTypeEnum.IMAGE:
-                send_func = self.wechat.client.send_image
-            case WeChatSendTypeEnum.EMOTION:
-                send_func = self.wechat.client.send_emotion
-            case WeChatSendTypeEnum.SHARE:
-                send_func = self.wechat.client.send_share
-            case WeChatSendTypeEnum.LOG:
-                send_func = self.wechat.client.send_log
+        send_func_info = self._send_funcs.get(send_params.send_type)
 
-            ## Throw exception.
-            case send_type:
-                throw(ValueError, send_type)
+        ## Throw exception.
+        if send_func_info is None:
+            throw(ValueError, send_params.send_type)
+
+        send_func, send_params_keys = send_func_info
 
         # Send.
-        arg_info = get_arg_info(send_func)
-        send_params_keys = [
-            item['name']
-            for item in arg_info
-        ]
         send_func_params = {
             key: value
             for key, value in send_params.params.items()
@@ -512,7 +519,7 @@ class WeChatSender(WeChatBase):
         """
 
         # Parameter.
-        if type(receive_id) == str:
+        if type(receive_id) is str:
             receive_ids = [receive_id]
         else:
             receive_ids = receive_id
@@ -542,14 +549,10 @@ class WeChatSender(WeChatBase):
                     *arg,
                     **kwargs
                 )
-            except BaseException:
-                *_, exc, _ = catch_exc()
+            except BaseException as exc:
 
                 # Report.
-                if not isinstance(
-                    exc,
-                    (WeChatTriggerContinueExit, WeChatTriggerBreakExit)
-                ):
+                if not isinstance(exc, WeChatTriggerExit):
                     text = '\n'.join(
                         [
                             str(arg)
@@ -579,6 +582,7 @@ class WeChatSender(WeChatBase):
 
         # Start.
         self.started = True
+        self.started_event.set()
 
         # Report.
         print('Start sender.')
@@ -591,6 +595,7 @@ class WeChatSender(WeChatBase):
 
         # Stop.
         self.started = False
+        self.started_event.clear()
 
         # Report.
         print('Stop sender.')
@@ -603,6 +608,7 @@ class WeChatSender(WeChatBase):
 
         # End.
         self.started = None
+        self.started_event.set()
 
         # Report.
         print('End sender.')
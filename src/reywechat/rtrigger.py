@@ -11,25 +11,42 @@
 
 from typing import Any, TypedDict, NoReturn
 from collections.abc import Callable
+from bisect import bisect_right
+from enum import StrEnum
+from threading import Lock
 from reykit.rbase import catch_exc
 
-from .rbase import WeChatBase, WeChatTriggerContinueExit, WeChatTriggerBreakExit
+from .rbase import WeChatBase, WeChatTriggerExit, WeChatTriggerContinueExit, WeChatTriggerBreakExit
 from .rreceive import WeChatMessage, WechatReceiver
 
 
 __all__ = (
-    'WeChatTrigger',
+    'WeChatTriggerFlowEnum',
+    'WeChatTrigger'
 )
 
 
 TriggerRule = TypedDict('TriggerRule', {'level': float, 'execute': Callable[[WeChatMessage], None], 'is_reply': bool})
 
 
+class WeChatTriggerFlowEnum(WeChatBase, StrEnum):
+    """
+    WeChat trigger flow enumeration type, return by trigger execute function.
+    """
+
+    CONTINUE = 'continue'
+    'Continue next execution, same as return `None`.'
+    BREAK = 'break'
+    'Stop executes.'
+
+
 class WeChatTrigger(WeChatBase):
     """
     WeChat trigger type.
     """
 
+    FlowEnum = WeChatTriggerFlowEnum
+
 
     def __init__(
         self,
@@ -45,7 +62,13 @@ class WeChatTrigger(WeChatBase):
 
         # Set attribute.
         self.receiver = receiver
-        self.rules: list[TriggerRule] = []
+        self.rules: tuple[TriggerRule, ...] = ()
+        'Read only, add through method `add_rule`.'
+        self._rules_levels: list[float] = []
+        'Negative levels of rules, same sort as rules.'
+        self._rules_dispatch: tuple[tuple[TriggerRule, Callable[[WeChatMessage], Any], bool], ...] = ()
+        'Snapshot of rules for dispatch, replace whole when add rule, dispatch iterate without lock.'
+        self._rules_lock = Lock()
 
         # Add handler.
         self.handler = self.__add_receiver_handler_trigger_by_rule()
@@ -74,28 +97,26 @@ class WeChatTrigger(WeChatBase):
             """
 
             # Loop.
-            for rule in self.rules:
-                message.triggering_rule = rule
+            for rule, execute, is_reply in self._rules_dispatch:
 
                 # Replied.
                 if (
-                    message.replied_rule is not None
-                    and rule['is_reply']
+                    is_reply
+                    and message.replied_rule is not None
                 ):
                     continue
 
                 # Trigger.
+                message.triggering_rule = rule
                 try:
-                    rule['execute'](message)
+                    result = execute(message)
 
-                # Continue.
-                except WeChatTriggerContinueExit:
+                # Continue or break.
+                except WeChatTriggerExit as exit_:
+                    if isinstance(exit_, WeChatTriggerBreakExit):
+                        break
                     continue
 
-                # Break.
-                except WeChatTriggerBreakExit:
-                    break
-
                 # Exception.
                 except BaseException:
 
@@ -105,8 +126,13 @@ class WeChatTrigger(WeChatBase):
                     ## Save.
                     message.exc_reports.append(exc_text)
 
-                finally:
-                    message.triggering_rule = None
+                # Flow.
+                else:
+                    if result is WeChatTriggerFlowEnum.BREAK:
+                        break
+
+            # Reset.
+            message.triggering_rule = None
 
 
         # Add handler.
@@ -130,6 +156,7 @@ class WeChatTrigger(WeChatBase):
             Function name must start with `reply_` to allow use of `WeChatMessage.reply`.
             When throw `WeChatTriggerContinueExit` type exception, then continue next execution.
             When throw `WeChatTriggerBreakExit` type exception, then stop executes.
+            When return `WeChatTriggerFlowEnum.BREAK`, then stop executes, without throwing exception.
         level : Priority level, sort from large to small.
         is_reply : Whehter is reply function, allow call `WeChatMessage.reply`, can only reply once function.
         """
@@ -141,15 +168,20 @@ class WeChatTrigger(WeChatBase):
             'is_reply': is_reply
         }
 
-        # Add.
-        self.rules.append(rule)
+        with self._rules_lock:
+
+            # Add, keep sort from large to small, same level in add order.
+            index = bisect_right(self._rules_levels, -level)
+            self._rules_levels.insert(index, -level)
+            rules = list(self.rules)
+            rules.insert(index, rule)
+            self.rules = tuple(rules)
 
-        # Sort.
-        fund_sort = lambda rule: rule['level']
-        self.rules.sort(
-            key=fund_sort,
-            reverse=True
-        )
+            # Compile.
+            self._rules_dispatch = tuple(
+                (rule, rule['execute'], rule['is_reply'])
+                for rule in self.rules
+            )
 
 
     def continue_(self) -> NoReturn:
@@ -180,20 +212,24 @@ class WeChatTrigger(WeChatBase):
         """
 
 
-        def trigger_valid(message: WeChatMessage) -> None:
+        def trigger_valid(message: WeChatMessage) -> WeChatTriggerFlowEnum | None:
             """
             Trigger rule judge valid.
 
             Parameters
             ----------
             message : `WeChatMessage` instance.
+
+            Returns
+            -------
+            Trigger flow.
             """
 
             # Judge.
             if not message.valid:
 
                 # Break.
-                message.trigger_break()
+                return WeChatTriggerFlowEnum.BREAK
 
 
         # Add.
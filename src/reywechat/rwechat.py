@@ -66,6 +66,7 @@ class WeChat(WeChatBase):
         from .rlog import WeChatLog
         from .rreceive import WechatReceiver
         from .rsend import WeChatSendTypeEnum, WeChatSenderStatusEnum, WeChatSender
+        from .rtrigger import WeChatTriggerFlowEnum
 
         # Build.
 
@@ -84,6 +85,7 @@ class WeChat(WeChatBase):
         self.receive_stop = self.receiver.stop
 
         ## Trigger.
+        self.TriggerFlowEnum = WeChatTriggerFlowEnum
         self.trigger_add_rule = self.trigger.add_rule
 
         ## Send.